@@ -3,15 +3,24 @@
 from __future__ import annotations
 
 import logging
-from configparser import ConfigParser
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
+import numpy as np
+
+try:  # pragma: no cover - dépend de l'environnement d'exécution
+    from numba import njit
+
+    _HAS_NUMBA = True
+except ImportError:  # pragma: no cover
+    _HAS_NUMBA = False
+
+from .config import load_cached_config
 from .database import ColdPeriodAlert, DatabaseManager
-from .notifications import NotificationMessage, format_plant_alert_message
-from .weather import HourlyTemperature, MeteoFranceWeatherClient
+from .notifications import NotificationMessage, format_short_datetime
+from .weather import ForecastFrame, HourlyTemperature, MeteoFranceWeatherClient
 
 LOGGER = logging.getLogger(__name__)
 
@@ -30,6 +39,9 @@ class ColdPeriod:
     def duration_hours(self) -> float:
         return max(0.0, (self.end_date - self.start_date).total_seconds() / 3600.0)
 
+    def format_range(self) -> str:
+        return f"{format_short_datetime(self.start_date)} \u2192 {format_short_datetime(self.end_date)}"
+
 
 @dataclass(slots=True)
 class AlertAction:
@@ -58,69 +70,131 @@ _THRESHOLD_MAPPING: List[Tuple[str, float]] = [
     ("below_vigilance", 3.0),
     ("below_freeze", 0.0),
 ]
+_FREEZE_VALUE: float = 0.0
 
 
 def configure_thresholds(vigilance: float, freeze: float) -> None:
     """Met à jour les seuils utilisés pour la détection des périodes froides."""
 
-    global _THRESHOLD_MAPPING
+    global _THRESHOLD_MAPPING, _FREEZE_VALUE
     _THRESHOLD_MAPPING = [
         ("below_vigilance", float(vigilance)),
         ("below_freeze", float(freeze)),
     ]
-
-
-def detect_cold_periods(forecast: List[HourlyTemperature]) -> List[ColdPeriod]:
+    _FREEZE_VALUE = float(freeze)
+
+
+def _find_cold_runs_numpy(temps: np.ndarray, mask: np.ndarray) -> List[Tuple[int, int, int]]:
+    """Retourne les plages continues (start, stop, min_idx) du masque donné."""
+
+    edges = np.flatnonzero(np.diff(np.r_[np.int8(0), mask.view(np.int8), np.int8(0)]))
+    runs: List[Tuple[int, int, int]] = []
+    for start, stop in zip(edges[::2], edges[1::2]):
+        min_idx = int(start + np.argmin(temps[start:stop]))
+        runs.append((int(start), int(stop), min_idx))
+    return runs
+
+
+if _HAS_NUMBA:
+
+    @njit(cache=True)
+    def _find_cold_runs_jit(temps, mask):  # pragma: no cover - code compilé
+        n = temps.shape[0]
+        starts = np.empty(n, np.int64)
+        stops = np.empty(n, np.int64)
+        min_idxs = np.empty(n, np.int64)
+        count = 0
+        cur_start = -1
+        cur_min_idx = -1
+        for i in range(n):
+            if mask[i]:
+                if cur_start < 0:
+                    cur_start = i
+                    cur_min_idx = i
+                elif temps[i] < temps[cur_min_idx]:
+                    cur_min_idx = i
+            elif cur_start >= 0:
+                starts[count] = cur_start
+                stops[count] = i
+                min_idxs[count] = cur_min_idx
+                count += 1
+                cur_start = -1
+        if cur_start >= 0:
+            starts[count] = cur_start
+            stops[count] = n
+            min_idxs[count] = cur_min_idx
+            count += 1
+        return starts[:count], stops[:count], min_idxs[:count]
+
+
+def _find_cold_runs(temps: np.ndarray, mask: np.ndarray) -> List[Tuple[int, int, int]]:
+    """Détecte les plages froides via Numba si disponible, sinon NumPy."""
+
+    if _HAS_NUMBA:
+        starts, stops, min_idxs = _find_cold_runs_jit(temps, mask)
+        return [
+            (int(start), int(stop), int(min_idx))
+            for start, stop, min_idx in zip(starts, stops, min_idxs)
+        ]
+    return _find_cold_runs_numpy(temps, mask)
+
+
+def warmup() -> None:
+    """Compile les fonctions jitées hors du chemin critique (coût payé une fois)."""
+
+    if not _HAS_NUMBA:
+        return
+    _find_cold_runs_jit(np.zeros(2, np.float64), np.zeros(2, np.bool_))
+
+
+def detect_cold_periods(forecast: List[HourlyTemperature] | ForecastFrame) -> List[ColdPeriod]:
     """Détecte les périodes froides continues pour chaque seuil configuré."""
 
-    if not forecast:
+    if not len(forecast):
         return []
 
-    sorted_forecast = sorted(forecast, key=lambda item: item.timestamp_local)
-    periods: List[ColdPeriod] = []
+    if isinstance(forecast, ForecastFrame):
+        # Chemin SoA : les colonnes sont déjà des tableaux, seules les bornes
+        # des périodes détectées seront matérialisées en datetime.
+        frame = forecast
+        order = np.argsort(frame.ts_utc, kind="stable")
+        temps = frame.temps[order]
+
+        def _local_time(index: int) -> datetime:
+            return frame.local_datetime(int(order[index]))
+
+    else:
+        timestamps = np.fromiter(
+            (entry.timestamp_local.timestamp() for entry in forecast),
+            dtype=np.int64,
+            count=len(forecast),
+        )
+        order = np.argsort(timestamps, kind="stable")
+        temps = np.fromiter(
+            (forecast[int(i)].temperature_c for i in order),
+            dtype=np.float64,
+            count=len(forecast),
+        )
+        local_times = [forecast[int(i)].timestamp_local for i in order]
 
-    for attribute, threshold in _THRESHOLD_MAPPING:
-        current_start: Optional[datetime] = None
-        current_end: Optional[datetime] = None
-        current_min_temp: Optional[float] = None
-        current_min_date: Optional[datetime] = None
-
-        for entry in sorted_forecast:
-            is_cold = bool(getattr(entry, attribute, False))
-            if is_cold:
-                if current_start is None:
-                    current_start = entry.timestamp_local
-                    current_end = entry.timestamp_local
-                    current_min_temp = entry.temperature_c
-                    current_min_date = entry.timestamp_local
-                else:
-                    current_end = entry.timestamp_local
-                    if entry.temperature_c < float(current_min_temp):
-                        current_min_temp = entry.temperature_c
-                        current_min_date = entry.timestamp_local
-            elif current_start is not None:
-                periods.append(
-                    ColdPeriod(
-                        threshold=threshold,
-                        start_date=current_start,
-                        end_date=current_end or current_start,
-                        min_temp=float(current_min_temp),
-                        min_temp_date=current_min_date or current_start,
-                    )
-                )
-                current_start = None
-                current_end = None
-                current_min_temp = None
-                current_min_date = None
+        def _local_time(index: int) -> datetime:
+            return local_times[index]
+
+    # Une seule passe sur les températures : les masques des deux seuils sont
+    # produits par une comparaison broadcastée (2, N).
+    thresholds = np.array([value for _attr, value in _THRESHOLD_MAPPING], dtype=np.float64)
+    masks = temps[None, :] <= thresholds[:, None]
 
-        if current_start is not None:
+    periods: List[ColdPeriod] = []
+    for (_attribute, threshold), mask in zip(_THRESHOLD_MAPPING, masks):
+        for start, stop, min_idx in _find_cold_runs(temps, np.ascontiguousarray(mask)):
             periods.append(
                 ColdPeriod(
                     threshold=threshold,
-                    start_date=current_start,
-                    end_date=current_end or current_start,
-                    min_temp=float(current_min_temp),
-                    min_temp_date=current_min_date or current_start,
+                    start_date=_local_time(start),
+                    end_date=_local_time(stop - 1),
+                    min_temp=float(temps[min_idx]),
+                    min_temp_date=_local_time(min_idx),
                 )
             )
 
@@ -129,9 +203,14 @@ def detect_cold_periods(forecast: List[HourlyTemperature]) -> List[ColdPeriod]:
 
 
 def compare_periods(new_periods: List[ColdPeriod], existing_alerts: List[ColdPeriodAlert]) -> List[AlertAction]:
-    """Compare les périodes détectées aux alertes enregistrées."""
+    """Compare les périodes détectées aux alertes enregistrées.
+
+    Seules les actions qui entraînent une écriture ou une notification sont
+    matérialisées : les périodes inchangées ne produisent aucune action.
+    """
 
     actions: List[AlertAction] = []
+    pending_updates: List[AlertAction] = []
     existing_by_threshold: Dict[float, List[ColdPeriodAlert]] = {}
     for alert in existing_alerts:
         existing_by_threshold.setdefault(alert.threshold, []).append(alert)
@@ -142,19 +221,27 @@ def compare_periods(new_periods: List[ColdPeriod], existing_alerts: List[ColdPer
 
     thresholds = set(existing_by_threshold.keys()) | set(new_by_threshold.keys())
     for threshold in sorted(thresholds, reverse=True):
-        current_existing = sorted(existing_by_threshold.get(threshold, []), key=lambda a: a.start_date)
-        current_new = sorted(new_by_threshold.get(threshold, []), key=lambda p: p.start_date)
-
-        matched_ids: set[int] = set()
+        # detect_cold_periods et get_active_alerts livrent déjà des listes
+        # triées par start_date : le regroupement préserve cet ordre.
+        current_existing = existing_by_threshold.get(threshold, [])
+        current_new = new_by_threshold.get(threshold, [])
+        assert all(a.start_date <= b.start_date for a, b in zip(current_existing, current_existing[1:]))
+        assert all(a.start_date <= b.start_date for a, b in zip(current_new, current_new[1:]))
+
+        # Les deux listes sont triées par start_date et les périodes d'un même
+        # seuil sont disjointes : un balayage fusionné à deux pointeurs suffit.
+        matched = np.zeros(len(current_existing), dtype=bool)
+        index = 0
 
         for period in current_new:
+            while index < len(current_existing) and current_existing[index].end_date < period.start_date:
+                index += 1
+
             matched_alert: Optional[ColdPeriodAlert] = None
-            for candidate in current_existing:
-                if candidate.alert_id in matched_ids:
-                    continue
-                if _periods_overlap(period.start_date, period.end_date, candidate.start_date, candidate.end_date):
-                    matched_alert = candidate
-                    break
+            if index < len(current_existing) and current_existing[index].start_date <= period.end_date:
+                matched_alert = current_existing[index]
+                matched[index] = True
+                index += 1
 
             if matched_alert is None:
                 reason = "NEW_THRESHOLD" if _is_freeze_threshold(threshold) else "NEW_PERIOD"
@@ -168,38 +255,20 @@ def compare_periods(new_periods: List[ColdPeriod], existing_alerts: List[ColdPer
                 )
                 continue
 
-            matched_ids.add(matched_alert.alert_id)
             previous_period = _alert_to_period(matched_alert)
-            reason, hours_extended, hours_shortened = _evaluate_period_changes(previous_period, period)
-
-            if reason == "NO_CHANGE":
-                actions.append(
-                    AlertAction(
-                        action_type="IGNORE",
-                        period=period,
-                        existing_alert_id=matched_alert.alert_id,
-                        notification_reason=reason,
-                        previous_period=previous_period,
-                        previous_alert=matched_alert,
-                    )
-                )
-                continue
-
-            actions.append(
-                AlertAction(
-                    action_type="UPDATE",
-                    period=period,
-                    existing_alert_id=matched_alert.alert_id,
-                    notification_reason=reason,
-                    previous_period=previous_period,
-                    previous_alert=matched_alert,
-                    hours_extended=hours_extended,
-                    hours_shortened=hours_shortened,
-                )
+            update_action = AlertAction(
+                action_type="UPDATE",
+                period=period,
+                existing_alert_id=matched_alert.alert_id,
+                notification_reason="NO_CHANGE",
+                previous_period=previous_period,
+                previous_alert=matched_alert,
             )
+            actions.append(update_action)
+            pending_updates.append(update_action)
 
-        for alert in current_existing:
-            if alert.alert_id in matched_ids:
+        for position, alert in enumerate(current_existing):
+            if matched[position]:
                 continue
             previous_period = _alert_to_period(alert)
             actions.append(
@@ -213,36 +282,38 @@ def compare_periods(new_periods: List[ColdPeriod], existing_alerts: List[ColdPer
                 )
             )
 
+    # Les raisons des mises à jour sont évaluées en lot (vectorisé dès que le
+    # volume le justifie) ; les périodes inchangées sont ensuite écartées.
+    _assign_update_reasons(pending_updates)
+    if pending_updates:
+        actions = [
+            action
+            for action in actions
+            if not (action.action_type == "UPDATE" and action.notification_reason == "NO_CHANGE")
+        ]
     return actions
 
 
-def should_notify(action: AlertAction, min_change_hours: int = 6) -> bool:
-    """Détermine si une notification doit être envoyée pour l'action donnée."""
+_ALWAYS_NOTIFY_TYPES = frozenset({"CREATE", "DELETE"})
+_ALWAYS_NOTIFY_UPDATE_REASONS = frozenset(
+    {"PERIOD_EXTENDED", "NEW_THRESHOLD", "MIN_TEMP_CHANGED", "PERIOD_SHIFTED"}
+)
 
-    if action.action_type == "IGNORE":
-        return False
 
-    if action.action_type == "CREATE":
-        return True
+def should_notify(action: AlertAction, min_change_hours: int = 6) -> bool:
+    """Détermine si une notification doit être envoyée pour l'action donnée."""
 
-    if action.action_type == "DELETE":
+    action_type = action.action_type
+    if action_type in _ALWAYS_NOTIFY_TYPES:
         return True
-
-    if action.action_type != "UPDATE":
+    if action_type != "UPDATE":
         return False
 
     reason = action.notification_reason
-    if reason in {"PERIOD_EXTENDED", "NEW_THRESHOLD"}:
+    if reason in _ALWAYS_NOTIFY_UPDATE_REASONS:
         return True
-
-    if reason == "PERIOD_SHORTENED":
-        if action.hours_shortened is None:
-            return False
+    if reason == "PERIOD_SHORTENED" and action.hours_shortened is not None:
         return action.hours_shortened >= float(min_change_hours)
-
-    if reason in {"MIN_TEMP_CHANGED", "PERIOD_SHIFTED"}:
-        return True
-
     return False
 
 
@@ -250,6 +321,7 @@ def create_notification_messages(actions: List[AlertAction]) -> List[Notificatio
     """Crée les messages de notification associés aux actions."""
 
     notifications: List[NotificationData] = []
+    batch_timestamp = datetime.now()  # partagé par tout le lot
 
     for action in actions:
         threshold = action.period.threshold
@@ -257,20 +329,10 @@ def create_notification_messages(actions: List[AlertAction]) -> List[Notificatio
         title = "🥶 Alerte gel" if severity == "critical" else "🌡️ Vigilance froid"
 
         if action.action_type == "CREATE":
-            message = format_plant_alert_message(
-                threshold=action.period.threshold,
-                start_date=action.period.start_date,
-                end_date=action.period.end_date,
-                min_temp=action.period.min_temp,
-            )
-            message.description = _format_new_period_message(action.period)
-            notifications.append(
-                NotificationData(
-                    action=action,
-                    message=message,
-                )
-            )
-            continue
+            # Construction directe : format_plant_alert_message produirait une
+            # description aussitôt écrasée.
+            title = "🥶 ALERTE PLANTES - Gel" if severity == "critical" else "🌡️ ALERTE PLANTES - Vigilance 3°C"
+            description = _format_new_period_message(action.period)
         elif action.action_type == "UPDATE":
             description = _format_update_message(action)
         elif action.action_type == "DELETE":
@@ -284,7 +346,7 @@ def create_notification_messages(actions: List[AlertAction]) -> List[Notificatio
             title=title,
             description=description,
             severity=severity,
-            timestamp=datetime.now(),
+            timestamp=batch_timestamp,
         )
 
         notifications.append(
@@ -303,8 +365,9 @@ def process_weather_alerts(config_path: Path) -> List[NotificationMessage]:
     Fonctionne toute l'année sans restriction saisonnière.
     """
 
-    config = ConfigParser()
-    config.read(config_path)
+    warmup()
+
+    config = load_cached_config(config_path)
 
     vigilance_threshold = config.getfloat("thresholds", "vigilance", fallback=3.0)
     freeze_threshold = config.getfloat("thresholds", "freeze", fallback=0.0)
@@ -312,10 +375,10 @@ def process_weather_alerts(config_path: Path) -> List[NotificationMessage]:
 
     min_change_hours = config.getint("notifications", "min_change_threshold", fallback=6)
 
-    db_manager = DatabaseManager.from_config(Path(config_path))
+    db_manager = DatabaseManager.from_parsed_config(config, config_path.resolve().parent.parent)
     db_manager.init_db()
 
-    weather_client = MeteoFranceWeatherClient.from_config(Path(config_path))
+    weather_client = MeteoFranceWeatherClient.from_config(config_path)
     forecast = weather_client.get_forecast_48h()
 
     detected_periods = detect_cold_periods(forecast)
@@ -339,39 +402,71 @@ def process_weather_alerts(config_path: Path) -> List[NotificationMessage]:
 
 
 def _persist_actions(db_manager: DatabaseManager, actions: Iterable[AlertAction]) -> None:
+    creates: List[AlertAction] = []
+    updates: List[AlertAction] = []
+    delete_ids: List[Tuple[int]] = []
+
     for action in actions:
         if action.action_type == "CREATE":
-            alert_id = db_manager.save_alert(
-                threshold=action.period.threshold,
-                start_date=action.period.start_date,
-                end_date=action.period.end_date,
-                min_temp=action.period.min_temp,
-                min_temp_date=action.period.min_temp_date,
-            )
-            action.existing_alert_id = alert_id
+            creates.append(action)
         elif action.action_type == "UPDATE":
             alert_id = action.existing_alert_id or (action.previous_alert.alert_id if action.previous_alert else None)
             if alert_id is None:
                 LOGGER.warning("Alerte sans identifiant pour mise à jour – création forcée")
-                alert_id = db_manager.save_alert(
-                    threshold=action.period.threshold,
-                    start_date=action.period.start_date,
-                    end_date=action.period.end_date,
-                    min_temp=action.period.min_temp,
-                    min_temp_date=action.period.min_temp_date,
-                )
                 action.action_type = "CREATE"
-                action.existing_alert_id = alert_id
+                creates.append(action)
                 continue
-            _update_alert_record(
-                db_manager,
-                alert_id,
-                action.period,
-            )
             action.existing_alert_id = alert_id
+            updates.append(action)
         elif action.action_type == "DELETE":
             if action.existing_alert_id is not None:
-                db_manager.delete_alert(action.existing_alert_id)
+                delete_ids.append((action.existing_alert_id,))
+
+    if not creates and not updates and not delete_ids:
+        return
+
+    # Une seule transaction pour l'ensemble des écritures : un seul fsync
+    # au lieu d'un commit implicite par action.
+    created_at_epoch = int(datetime.now().timestamp())
+    with db_manager.connection() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        for action in creates:
+            cursor = conn.execute(
+                """
+                INSERT INTO current_alerts (threshold, start_date, end_date, min_temp, min_temp_date, created_at, last_notified_at)
+                VALUES (?, ?, ?, ?, ?, ?, NULL)
+                """,
+                (
+                    action.period.threshold,
+                    int(action.period.start_date.timestamp()),
+                    int(action.period.end_date.timestamp()),
+                    float(action.period.min_temp),
+                    int(action.period.min_temp_date.timestamp()),
+                    created_at_epoch,
+                ),
+            )
+            action.existing_alert_id = int(cursor.lastrowid)
+        if updates:
+            conn.executemany(
+                """
+                UPDATE current_alerts
+                SET start_date = ?, end_date = ?, min_temp = ?, min_temp_date = ?
+                WHERE id = ?
+                """,
+                [
+                    (
+                        int(action.period.start_date.timestamp()),
+                        int(action.period.end_date.timestamp()),
+                        float(action.period.min_temp),
+                        int(action.period.min_temp_date.timestamp()),
+                        action.existing_alert_id,
+                    )
+                    for action in updates
+                ],
+            )
+        if delete_ids:
+            conn.executemany("DELETE FROM current_alerts WHERE id = ?", delete_ids)
+        conn.commit()
 
 
 def _alert_to_period(alert: ColdPeriodAlert) -> ColdPeriod:
@@ -384,29 +479,8 @@ def _alert_to_period(alert: ColdPeriodAlert) -> ColdPeriod:
     )
 
 
-def _update_alert_record(db_manager: DatabaseManager, alert_id: int, period: ColdPeriod) -> None:
-    with db_manager.connection() as conn:
-        conn.execute(
-            """
-            UPDATE current_alerts
-            SET start_date = ?, end_date = ?, min_temp = ?, min_temp_date = ?
-            WHERE id = ?
-            """,
-            (
-                period.start_date.isoformat(),
-                period.end_date.isoformat(),
-                float(period.min_temp),
-                period.min_temp_date.isoformat(),
-                alert_id,
-            ),
-        )
-
-
 def _format_new_period_message(period: ColdPeriod) -> str:
-    return (
-        "📅 Période froide prévue : "
-        f"{period.start_date.strftime('%d/%m %Hh')} → {period.end_date.strftime('%d/%m %Hh')}"
-    )
+    return f"📅 Période froide prévue : {period.format_range()}"
 
 
 def _format_update_message(action: AlertAction) -> str:
@@ -414,8 +488,8 @@ def _format_update_message(action: AlertAction) -> str:
         return _format_new_period_message(action.period)
 
     previous = action.previous_period
-    now_range = f"{action.period.start_date.strftime('%d/%m %Hh')} → {action.period.end_date.strftime('%d/%m %Hh')}"
-    old_range = f"{previous.start_date.strftime('%d/%m %Hh')} → {previous.end_date.strftime('%d/%m %Hh')}"
+    now_range = action.period.format_range()
+    old_range = previous.format_range()
 
     if action.notification_reason == "MIN_TEMP_CHANGED":
         return (
@@ -433,15 +507,12 @@ def _format_end_message(previous: Optional[ColdPeriod]) -> str:
     if previous is None:
         return "✅ Fin période froide : plus de risque prévu"
 
-    old_range = f"{previous.start_date.strftime('%d/%m %Hh')} → {previous.end_date.strftime('%d/%m %Hh')}"
+    old_range = previous.format_range()
     return "✅ Fin période froide : plus de risque prévu (\u2744️ " + old_range + ")"
 
 
 def _is_freeze_threshold(threshold: float) -> bool:
-    freeze_values = [value for attr, value in _THRESHOLD_MAPPING if attr == "below_freeze"]
-    if not freeze_values:
-        return threshold <= 0.0
-    return threshold <= freeze_values[0]
+    return threshold <= _FREEZE_VALUE
 
 
 def _periods_overlap(start_a: datetime, end_a: datetime, start_b: datetime, end_b: datetime) -> bool:
@@ -475,6 +546,58 @@ def _evaluate_period_changes(previous: ColdPeriod, current: ColdPeriod) -> Tuple
     return "PERIOD_SHIFTED", None, None
 
 
+_VECTORIZE_UPDATES_MIN = 8
+
+
+def _assign_update_reasons(updates: List[AlertAction]) -> None:
+    """Évalue les changements de période pour un lot d'actions UPDATE.
+
+    En dessous de _VECTORIZE_UPDATES_MIN paires, la version scalaire est plus
+    rapide que la construction des tableaux NumPy.
+    """
+
+    if not updates:
+        return
+
+    if len(updates) < _VECTORIZE_UPDATES_MIN:
+        for action in updates:
+            reason, hours_extended, hours_shortened = _evaluate_period_changes(
+                action.previous_period, action.period
+            )
+            action.notification_reason = reason
+            action.hours_extended = hours_extended
+            action.hours_shortened = hours_shortened
+        return
+
+    count = len(updates)
+    prev_starts = np.fromiter((a.previous_period.start_date.timestamp() for a in updates), np.int64, count)
+    prev_ends = np.fromiter((a.previous_period.end_date.timestamp() for a in updates), np.int64, count)
+    prev_mins = np.fromiter((a.previous_period.min_temp for a in updates), np.float64, count)
+    cur_starts = np.fromiter((a.period.start_date.timestamp() for a in updates), np.int64, count)
+    cur_ends = np.fromiter((a.period.end_date.timestamp() for a in updates), np.int64, count)
+    cur_mins = np.fromiter((a.period.min_temp for a in updates), np.float64, count)
+
+    duration_delta = (cur_ends - cur_starts) - (prev_ends - prev_starts)
+    start_changed = prev_starts != cur_starts
+    end_changed = prev_ends != cur_ends
+    min_temp_changed = np.abs(prev_mins - cur_mins) >= 0.1
+    no_change = ~start_changed & ~end_changed & ~min_temp_changed
+
+    reasons = np.select(
+        [no_change, duration_delta > 0, duration_delta < 0, start_changed | end_changed, min_temp_changed],
+        ["NO_CHANGE", "PERIOD_EXTENDED", "PERIOD_SHORTENED", "PERIOD_SHIFTED", "MIN_TEMP_CHANGED"],
+        default="PERIOD_SHIFTED",
+    )
+    hours_delta = duration_delta / 3600.0
+
+    for i, action in enumerate(updates):
+        action.notification_reason = str(reasons[i])
+        if hours_delta[i] > 0.0:
+            action.hours_extended = float(hours_delta[i])
+        elif hours_delta[i] < 0.0:
+            action.hours_shortened = float(-hours_delta[i])
+
+
 __all__ = [
     "AlertAction",
     "ColdPeriod",
@@ -484,4 +607,5 @@ __all__ = [
     "detect_cold_periods",
     "process_weather_alerts",
     "should_notify",
+    "warmup",
 ]
@@ -0,0 +1,33 @@
+"""Chargement partagé (et mis en cache) de la configuration PlantAlert."""
+
+from __future__ import annotations
+
+import functools
+import logging
+from configparser import ConfigParser
+from pathlib import Path
+
+LOGGER = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_config(path_str: str, mtime_ns: int) -> ConfigParser:
+    """Parse le fichier ; l'entrée est invalidée dès que le mtime change."""
+
+    parser = ConfigParser()
+    parser.read(path_str)
+    return parser
+
+
+def load_cached_config(config_path: Path | str) -> ConfigParser:
+    """Retourne le ConfigParser du fichier, sans relecture disque tant qu'il est inchangé.
+
+    Toutes les fabriques ``from_config`` passent par ici : un même run ne
+    parse le fichier qu'une seule fois, quel que soit le nombre d'appelants.
+    """
+
+    path = Path(config_path)
+    return _parse_config(str(path), path.stat().st_mtime_ns)
+
+
+__all__ = ["load_cached_config"]
@@ -5,21 +5,89 @@ from __future__ import annotations
 import json
 import logging
 import sqlite3
+import threading
 from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterator, List, Optional, Sequence
 
 from configparser import ConfigParser
 
+import orjson
+import zstandard
+
+from .config import load_cached_config
+
 LOGGER = logging.getLogger(__name__)
-def _to_iso(dt: datetime) -> str:
-    return dt.isoformat()
 
+_ZSTD_COMPRESSOR = zstandard.ZstdCompressor(level=3)
+_ZSTD_DECOMPRESSOR = zstandard.ZstdDecompressor()
+
+# Requêtes fréquentes en constantes de module : la même chaîne (même identité)
+# est présentée au cache de requêtes préparées de la connexion persistante.
+_SQL_SELECT_ACTIVE_ALERTS = (
+    "SELECT id, threshold, start_date, end_date, min_temp, min_temp_date, created_at, last_notified_at "
+    "FROM current_alerts WHERE end_date >= ? ORDER BY threshold DESC, start_date ASC"
+)
+_SQL_INSERT_ALERT = (
+    "INSERT INTO current_alerts (threshold, start_date, end_date, min_temp, min_temp_date, created_at, last_notified_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_SQL_UPDATE_LAST_NOTIFIED = "UPDATE current_alerts SET last_notified_at = ? WHERE id = ?"
+_SQL_DELETE_ALERT = "DELETE FROM current_alerts WHERE id = ?"
+_SQL_INSERT_NOTIFICATION = (
+    "INSERT INTO notification_history (alert_id, message, channels, sent_at) VALUES (?, ?, ?, ?)"
+)
+_SQL_SELECT_HISTORY = (
+    "SELECT id, alert_id, message, channels, sent_at FROM notification_history "
+    "WHERE alert_id = ? ORDER BY sent_at DESC"
+)
+
+
+def _to_epoch(dt: datetime) -> int:
+    return int(dt.timestamp())
+
+
+def _from_epoch(value: int) -> datetime:
+    return datetime.fromtimestamp(int(value), tz=timezone.utc).astimezone()
+
+
+def _legacy_to_epoch(value) -> Optional[int]:
+    """Convertit une date héritée (ISO TEXT ou epoch déjà migré) en epoch int.
+
+    La conversion passe par fromisoformat + timestamp() afin d'interpréter les
+    dates naïves en heure locale, exactement comme _to_epoch pour les
+    nouvelles écritures.
+    """
+
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    try:
+        return _to_epoch(datetime.fromisoformat(value))
+    except ValueError:
+        return int(float(value))
+
+
+def _column_type(conn: sqlite3.Connection, table: str, column: str) -> str:
+    """Retourne le type déclaré d'une colonne (chaîne vide si absent)."""
+
+    for row in conn.execute(f"PRAGMA table_info({table})"):
+        if row["name"] == column:
+            return (row["type"] or "").upper()
+    return ""
+
+
+def _parse_channels(value: Optional[str]) -> Sequence[str]:
+    """Décode la liste des canaux (JSON, avec repli CSV pour les anciennes lignes)."""
 
-def _from_iso(value: str) -> datetime:
-    return datetime.fromisoformat(value)
+    if not value:
+        return ()
+    if value.startswith("["):
+        return tuple(json.loads(value))
+    return tuple(filter(None, value.split(",")))
 
 
 @dataclass(slots=True)
@@ -63,14 +131,17 @@ class DatabaseManager:
         self.db_path = db_path
         self.timeout = timeout
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
 
     @classmethod
     def from_config(cls, config_path: Path) -> "DatabaseManager":
-        parser = ConfigParser()
-        parser.read(config_path)
+        parser = load_cached_config(config_path)
+        project_root = config_path.resolve().parent.parent
+        return cls.from_parsed_config(parser, project_root)
 
-        config_file = Path(config_path).resolve()
-        project_root = config_file.parent.parent
+    @classmethod
+    def from_parsed_config(cls, parser: ConfigParser, project_root: Path) -> "DatabaseManager":
+        """Construit le gestionnaire depuis une configuration déjà parsée."""
 
         db_path = Path(parser.get("database", "db_path", fallback="data/alerts.db"))
         if not db_path.is_absolute():
@@ -79,31 +150,55 @@ class DatabaseManager:
         timeout = parser.getfloat("database", "timeout", fallback=5.0)
         return cls(db_path=db_path, timeout=timeout)
 
+    def _get_connection(self) -> sqlite3.Connection:
+        """Retourne la connexion persistante du thread courant (créée au besoin)."""
+
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=self.timeout, cached_statements=256)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL;")
+            conn.execute("PRAGMA temp_store=MEMORY;")
+            conn.execute("PRAGMA cache_size=-8000;")
+            self._local.conn = conn
+        return conn
+
     @contextmanager
     def connection(self) -> Iterator[sqlite3.Connection]:
-        conn = sqlite3.connect(self.db_path, timeout=self.timeout)
-        conn.row_factory = sqlite3.Row
+        conn = self._get_connection()
         try:
             yield conn
-        finally:
+        except Exception:
+            conn.rollback()
+            raise
+        conn.commit()
+
+    def close(self) -> None:
+        """Ferme la connexion persistante du thread courant."""
+
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+        if conn is not None:
             conn.close()
+            self._local.conn = None
 
     def init_db(self) -> None:
         """Crée les tables nécessaires pour la détection des périodes froides."""
 
         LOGGER.debug("Initialisation de la base %s", self.db_path)
         with self.connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL;")
+            conn.execute("PRAGMA synchronous=NORMAL;")
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS current_alerts (
                     id INTEGER PRIMARY KEY,
                     threshold REAL NOT NULL,
-                    start_date TEXT NOT NULL,
-                    end_date TEXT NOT NULL,
+                    start_date INTEGER NOT NULL,
+                    end_date INTEGER NOT NULL,
                     min_temp REAL NOT NULL,
-                    min_temp_date TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    last_notified_at TEXT
+                    min_temp_date INTEGER NOT NULL,
+                    created_at INTEGER NOT NULL,
+                    last_notified_at INTEGER
                 );
                 """
             )
@@ -114,7 +209,7 @@ class DatabaseManager:
                     alert_id INTEGER,
                     message TEXT NOT NULL,
                     channels TEXT NOT NULL,
-                    sent_at TEXT NOT NULL,
+                    sent_at INTEGER NOT NULL,
                     FOREIGN KEY (alert_id) REFERENCES current_alerts (id)
                 );
                 """
@@ -123,11 +218,14 @@ class DatabaseManager:
                 """
                 CREATE TABLE IF NOT EXISTS forecast_cache (
                     id INTEGER PRIMARY KEY,
-                    forecast_data TEXT NOT NULL,
-                    fetched_at TEXT NOT NULL
+                    forecast_data BLOB NOT NULL,
+                    fetched_at INTEGER NOT NULL
                 );
                 """
             )
+            # La migration reconstruit les tables héritées : elle doit passer
+            # avant la création des index, recréés ensuite sur les tables finales.
+            self._migrate_legacy_dates(conn)
             conn.execute(
                 """
                 CREATE INDEX IF NOT EXISTS idx_current_alerts_threshold
@@ -140,37 +238,148 @@ class DatabaseManager:
                 ON notification_history(alert_id, sent_at DESC);
                 """
             )
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_current_alerts_end
+                ON current_alerts(end_date);
+                """
+            )
+
+    @staticmethod
+    def _migrate_legacy_dates(conn: sqlite3.Connection) -> None:
+        """Reconstruit les tables héritées dont les dates étaient en ISO TEXT.
+
+        Les colonnes TEXT gardent leur affinité même après UPDATE : la seule
+        migration fiable est de recréer chaque table avec des colonnes INTEGER
+        puis d'y recopier les lignes converties. La détection porte sur le type
+        déclaré, donc une base déjà migrée est laissée telle quelle.
+        """
+
+        if _column_type(conn, "current_alerts", "start_date") == "TEXT":
+            rows = conn.execute(
+                "SELECT id, threshold, start_date, end_date, min_temp, min_temp_date, created_at, last_notified_at "
+                "FROM current_alerts"
+            ).fetchall()
+            conn.execute(
+                """
+                CREATE TABLE current_alerts_migrated (
+                    id INTEGER PRIMARY KEY,
+                    threshold REAL NOT NULL,
+                    start_date INTEGER NOT NULL,
+                    end_date INTEGER NOT NULL,
+                    min_temp REAL NOT NULL,
+                    min_temp_date INTEGER NOT NULL,
+                    created_at INTEGER NOT NULL,
+                    last_notified_at INTEGER
+                );
+                """
+            )
+            conn.executemany(
+                "INSERT INTO current_alerts_migrated VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        row["id"],
+                        row["threshold"],
+                        _legacy_to_epoch(row["start_date"]),
+                        _legacy_to_epoch(row["end_date"]),
+                        row["min_temp"],
+                        _legacy_to_epoch(row["min_temp_date"]),
+                        _legacy_to_epoch(row["created_at"]),
+                        _legacy_to_epoch(row["last_notified_at"]),
+                    )
+                    for row in rows
+                ],
+            )
+            conn.execute("DROP TABLE current_alerts")
+            conn.execute("ALTER TABLE current_alerts_migrated RENAME TO current_alerts")
+            LOGGER.info("Dates ISO migrées vers epoch pour %d alertes", len(rows))
+
+        if _column_type(conn, "notification_history", "sent_at") == "TEXT":
+            rows = conn.execute(
+                "SELECT id, alert_id, message, channels, sent_at FROM notification_history"
+            ).fetchall()
+            conn.execute(
+                """
+                CREATE TABLE notification_history_migrated (
+                    id INTEGER PRIMARY KEY,
+                    alert_id INTEGER,
+                    message TEXT NOT NULL,
+                    channels TEXT NOT NULL,
+                    sent_at INTEGER NOT NULL,
+                    FOREIGN KEY (alert_id) REFERENCES current_alerts (id)
+                );
+                """
+            )
+            conn.executemany(
+                "INSERT INTO notification_history_migrated VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        row["id"],
+                        row["alert_id"],
+                        row["message"],
+                        row["channels"],
+                        _legacy_to_epoch(row["sent_at"]),
+                    )
+                    for row in rows
+                ],
+            )
+            conn.execute("DROP TABLE notification_history")
+            conn.execute(
+                "ALTER TABLE notification_history_migrated RENAME TO notification_history"
+            )
+            LOGGER.info("Historique de notifications migré (%d lignes)", len(rows))
+
+        if _column_type(conn, "forecast_cache", "fetched_at") == "TEXT":
+            rows = conn.execute(
+                "SELECT id, forecast_data, fetched_at FROM forecast_cache"
+            ).fetchall()
+            conn.execute(
+                """
+                CREATE TABLE forecast_cache_migrated (
+                    id INTEGER PRIMARY KEY,
+                    forecast_data BLOB NOT NULL,
+                    fetched_at INTEGER NOT NULL
+                );
+                """
+            )
+            conn.executemany(
+                "INSERT INTO forecast_cache_migrated VALUES (?, ?, ?)",
+                [
+                    (row["id"], row["forecast_data"], _legacy_to_epoch(row["fetched_at"]))
+                    for row in rows
+                ],
+            )
+            conn.execute("DROP TABLE forecast_cache")
+            conn.execute("ALTER TABLE forecast_cache_migrated RENAME TO forecast_cache")
+            LOGGER.info("Cache de prévisions migré (%d lignes)", len(rows))
 
     def get_active_alerts(self, reference_time: Optional[datetime] = None) -> List[ColdPeriodAlert]:
         """Retourne les périodes froides qui se chevauchent avec l'instant donné."""
 
         if reference_time is None:
             reference_time = datetime.now()
-        reference_iso = _to_iso(reference_time)
-
-        query = (
-            "SELECT id, threshold, start_date, end_date, min_temp, min_temp_date, created_at, last_notified_at "
-            "FROM current_alerts WHERE end_date >= ? ORDER BY start_date ASC"
-        )
+        reference_epoch = _to_epoch(reference_time)
 
+        # Tri aligné sur le regroupement de compare_periods : les listes par
+        # seuil sortent déjà ordonnées par start_date.
         with self.connection() as conn:
-            rows = conn.execute(query, (reference_iso,)).fetchall()
-
-        alerts: List[ColdPeriodAlert] = []
-        for row in rows:
-            alerts.append(
-                ColdPeriodAlert(
-                    alert_id=row["id"],
-                    threshold=row["threshold"],
-                    start_date=_from_iso(row["start_date"]),
-                    end_date=_from_iso(row["end_date"]),
-                    min_temp=row["min_temp"],
-                    min_temp_date=_from_iso(row["min_temp_date"]),
-                    created_at=_from_iso(row["created_at"]),
-                    last_notified_at=_from_iso(row["last_notified_at"]) if row["last_notified_at"] else None,
-                )
+            cursor = conn.cursor()
+            cursor.row_factory = None  # tuples positionnels : pas de hash par colonne
+            rows = cursor.execute(_SQL_SELECT_ACTIVE_ALERTS, (reference_epoch,)).fetchall()
+
+        return [
+            ColdPeriodAlert(
+                alert_id=alert_id,
+                threshold=threshold,
+                start_date=_from_epoch(start_date),
+                end_date=_from_epoch(end_date),
+                min_temp=min_temp,
+                min_temp_date=_from_epoch(min_temp_date),
+                created_at=_from_epoch(created_at),
+                last_notified_at=_from_epoch(last_notified_at) if last_notified_at else None,
             )
-        return alerts
+            for alert_id, threshold, start_date, end_date, min_temp, min_temp_date, created_at, last_notified_at in rows
+        ]
 
     def save_alert(
         self,
@@ -186,22 +395,18 @@ class DatabaseManager:
 
         created_at = created_at or datetime.now()
 
-        query = (
-            "INSERT INTO current_alerts (threshold, start_date, end_date, min_temp, min_temp_date, created_at, last_notified_at) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?)"
-        )
         params = (
             threshold,
-            _to_iso(start_date),
-            _to_iso(end_date),
+            _to_epoch(start_date),
+            _to_epoch(end_date),
             float(min_temp),
-            _to_iso(min_temp_date),
-            _to_iso(created_at),
-            _to_iso(last_notified_at) if last_notified_at else None,
+            _to_epoch(min_temp_date),
+            _to_epoch(created_at),
+            _to_epoch(last_notified_at) if last_notified_at else None,
         )
 
         with self.connection() as conn:
-            cursor = conn.execute(query, params)
+            cursor = conn.execute(_SQL_INSERT_ALERT, params)
             alert_id = cursor.lastrowid
             LOGGER.info("Période froide enregistrée (id=%s, seuil=%.1f)", alert_id, threshold)
             return int(alert_id)
@@ -211,57 +416,49 @@ class DatabaseManager:
 
         when = when or datetime.now()
         with self.connection() as conn:
-            conn.execute(
-                "UPDATE current_alerts SET last_notified_at = ? WHERE id = ?",
-                (_to_iso(when), alert_id),
-            )
+            conn.execute(_SQL_UPDATE_LAST_NOTIFIED, (_to_epoch(when), alert_id))
 
     def delete_alert(self, alert_id: int) -> None:
         """Supprime une période froide de la base."""
 
         with self.connection() as conn:
-            conn.execute("DELETE FROM current_alerts WHERE id = ?", (alert_id,))
+            conn.execute(_SQL_DELETE_ALERT, (alert_id,))
 
     def record_notification(self, alert_id: Optional[int], message: str, channels: Sequence[str], sent_at: Optional[datetime] = None) -> None:
         """Enregistre l'envoi d'une notification multi-canaux."""
 
         sent_at = sent_at or datetime.now()
-        channel_value = ",".join(channels)
+        channel_value = json.dumps(list(channels))
         with self.connection() as conn:
             conn.execute(
-                "INSERT INTO notification_history (alert_id, message, channels, sent_at) VALUES (?, ?, ?, ?)",
-                (alert_id, message, channel_value, _to_iso(sent_at)),
+                _SQL_INSERT_NOTIFICATION,
+                (alert_id, message, channel_value, _to_epoch(sent_at)),
             )
 
     def get_notification_history(self, alert_id: int) -> List[NotificationRecord]:
         """Retourne l'historique des notifications associées à une alerte."""
 
-        query = (
-            "SELECT id, alert_id, message, channels, sent_at FROM notification_history "
-            "WHERE alert_id = ? ORDER BY sent_at DESC"
-        )
         with self.connection() as conn:
-            rows = conn.execute(query, (alert_id,)).fetchall()
-
-        history: List[NotificationRecord] = []
-        for row in rows:
-            channels = tuple(filter(None, (row["channels"] or "").split(",")))
-            history.append(
-                NotificationRecord(
-                    notification_id=row["id"],
-                    alert_id=row["alert_id"],
-                    message=row["message"],
-                    channels=channels,
-                    sent_at=_from_iso(row["sent_at"]),
-                )
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            rows = cursor.execute(_SQL_SELECT_HISTORY, (alert_id,)).fetchall()
+
+        return [
+            NotificationRecord(
+                notification_id=notification_id,
+                alert_id=row_alert_id,
+                message=message,
+                channels=_parse_channels(channels),
+                sent_at=_from_epoch(sent_at),
             )
-        return history
+            for notification_id, row_alert_id, message, channels, sent_at in rows
+        ]
 
     def upsert_forecast_cache(self, forecast_data: dict, fetched_at: Optional[datetime] = None) -> None:
         """Met à jour le cache des prévisions 48h."""
 
         fetched_at = fetched_at or datetime.now()
-        payload = json.dumps(forecast_data, ensure_ascii=False)
+        payload = _ZSTD_COMPRESSOR.compress(orjson.dumps(forecast_data))
         with self.connection() as conn:
             conn.execute(
                 """
@@ -269,7 +466,7 @@ class DatabaseManager:
                 VALUES (1, ?, ?)
                 ON CONFLICT(id) DO UPDATE SET forecast_data = excluded.forecast_data, fetched_at = excluded.fetched_at
                 """,
-                (payload, _to_iso(fetched_at)),
+                (payload, _to_epoch(fetched_at)),
             )
 
     def get_forecast_cache(self) -> Optional[ForecastCacheEntry]:
@@ -283,10 +480,13 @@ class DatabaseManager:
         if not row:
             return None
 
+        raw = row["forecast_data"]
+        if isinstance(raw, bytes):
+            raw = _ZSTD_DECOMPRESSOR.decompress(raw)
         return ForecastCacheEntry(
             cache_id=row["id"],
-            forecast_data=json.loads(row["forecast_data"]),
-            fetched_at=_from_iso(row["fetched_at"]),
+            forecast_data=orjson.loads(raw),
+            fetched_at=_from_epoch(row["fetched_at"]),
         )
 
 
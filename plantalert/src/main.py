@@ -5,42 +5,78 @@ from __future__ import annotations
 import argparse
 import logging
 from logging.handlers import RotatingFileHandler
+import shlex
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from configparser import ConfigParser
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, List
-
-if __package__:
-    from .alerts import process_weather_alerts
-    from .database import DatabaseManager
-    from .notifications import (
-        NotificationMessage,
-        format_plant_alert_message,
-        send_discord_webhook,
-        send_notify_send,
-    )
-    from .weather import MeteoFranceWeatherClient
-else:  # pragma: no cover - support exécution directe
-    CURRENT_DIR = Path(__file__).resolve().parent
-    if str(CURRENT_DIR) not in sys.path:
-        sys.path.append(str(CURRENT_DIR))
-    from alerts import process_weather_alerts
-    from database import DatabaseManager
-    from notifications import (
-        NotificationMessage,
-        format_plant_alert_message,
-        send_discord_webhook,
-        send_notify_send,
-    )
-    from weather import MeteoFranceWeatherClient
+from typing import Iterable, List, Sequence
+
+# Renseignés par _import_runtime() : les modules métier (et leurs dépendances
+# tierces) ne sont chargés qu'une fois les arguments CLI validés.
+process_weather_alerts = None
+load_cached_config = None
+DatabaseManager = None
+NotificationMessage = None
+format_plant_alert_message = None
+send_discord_webhook = None
+send_discord_webhook_batch = None
+send_notify_send = None
+MeteoFranceWeatherClient = None
+
+
+def _import_runtime() -> None:
+    """Charge les modules métier à la première utilisation (pas pour --help)."""
+
+    global process_weather_alerts, load_cached_config, DatabaseManager
+    global NotificationMessage, format_plant_alert_message
+    global send_discord_webhook, send_discord_webhook_batch, send_notify_send
+    global MeteoFranceWeatherClient
+
+    if process_weather_alerts is not None:
+        return
+
+    if __package__:
+        from . import alerts, config, database, notifications, weather
+    else:  # pragma: no cover - support exécution directe
+        current_dir = Path(__file__).resolve().parent
+        if str(current_dir) not in sys.path:
+            sys.path.append(str(current_dir))
+        import alerts
+        import config
+        import database
+        import notifications
+        import weather
+
+    process_weather_alerts = alerts.process_weather_alerts
+    load_cached_config = config.load_cached_config
+    DatabaseManager = database.DatabaseManager
+    NotificationMessage = notifications.NotificationMessage
+    format_plant_alert_message = notifications.format_plant_alert_message
+    send_discord_webhook = notifications.send_discord_webhook
+    send_discord_webhook_batch = notifications.send_discord_webhook_batch
+    send_notify_send = notifications.send_notify_send
+    MeteoFranceWeatherClient = weather.MeteoFranceWeatherClient
+
 
 LOGGER = logging.getLogger(__name__)
 _PLACEHOLDER_WEBHOOK = "https://discord.com/api/webhooks/CHANGEME"
 _PLACEHOLDER_SSH = "val@192.168.1.100"
 
+# Multiplexage SSH : la première connexion laisse un master ouvert 60s,
+# les invocations suivantes réutilisent le canal sans nouveau handshake.
+_SSH_CONTROL_OPTIONS = [
+    "-o",
+    "ControlMaster=auto",
+    "-o",
+    "ControlPath=~/.ssh/cm-%r@%h:%p",
+    "-o",
+    "ControlPersist=60",
+]
+
 
 def parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
     """Analyse les arguments CLI."""
@@ -66,9 +102,8 @@ def load_config(config_path: Path) -> ConfigParser:
     if not config_path.exists():
         raise FileNotFoundError(f"Fichier de configuration introuvable: {config_path}")
 
-    config = ConfigParser()
-    config.read(config_path)
-    return config
+    _import_runtime()
+    return load_cached_config(config_path)
 
 
 def configure_logging(config: ConfigParser) -> None:
@@ -97,21 +132,18 @@ def configure_logging(config: ConfigParser) -> None:
 
 
 def send_discord_notifications(
-    messages: Iterable[NotificationMessage],
+    messages: Sequence[NotificationMessage],
     webhook_url: str,
     *,
     dry_run: bool = False,
 ) -> List[bool]:
-    """Envoie les notifications vers Discord."""
-
-    messages_list = list(messages)
-    results: List[bool] = []
+    """Envoie les notifications vers Discord (séquence déjà matérialisée)."""
 
     if not webhook_url or webhook_url.strip() == "":
-        if messages_list:
+        if messages:
             LOGGER.info(
                 "Webhook Discord non configuré. %d messages ignorés.",
-                len(messages_list),
+                len(messages),
             )
         return []
 
@@ -119,23 +151,24 @@ def send_discord_notifications(
     if webhook_url == _PLACEHOLDER_WEBHOOK:
         LOGGER.info(
             "Webhook Discord de placeholder, envoi ignoré pour %d messages.",
-            len(messages_list),
+            len(messages),
         )
         return []
 
-    for message in messages_list:
-        if dry_run:
+    if not messages:
+        return []
+
+    if dry_run:
+        for message in messages:
             LOGGER.info("[DRY-RUN] Discord → %s", message.title)
-            results.append(True)
-            continue
+        return [True] * len(messages)
 
-        success = send_discord_webhook(webhook_url, message)
+    results = send_discord_webhook_batch(webhook_url, messages)
+    for message, success in zip(messages, results):
         if success:
             LOGGER.info("Notification Discord envoyée: %s", message.title)
         else:
             LOGGER.error("Echec notification Discord: %s", message.title)
-        results.append(success)
-
     return results
 
 
@@ -149,7 +182,7 @@ def send_notify_send_ssh(message: NotificationMessage, ssh_host: str) -> bool:
     if ssh_host in {"local", "localhost"}:
         return send_notify_send(message)
 
-    command = ["ssh", ssh_host, *message.to_notify_send_args()]
+    command = ["ssh", *_SSH_CONTROL_OPTIONS, ssh_host, *message.to_notify_send_args()]
     try:
         subprocess.run(command, check=True, timeout=20)
     except subprocess.TimeoutExpired as exc:
@@ -163,20 +196,47 @@ def send_notify_send_ssh(message: NotificationMessage, ssh_host: str) -> bool:
     return True
 
 
+def send_notify_send_ssh_batch(
+    messages: Sequence[NotificationMessage], ssh_host: str
+) -> List[bool]:
+    """Envoie toutes les notifications notify-send en une seule invocation SSH."""
+
+    ssh_host = ssh_host.strip()
+    if not ssh_host or ssh_host in {"local", "localhost"}:
+        return [send_notify_send(message) for message in messages]
+
+    remote_script = " && ".join(
+        shlex.join(message.to_notify_send_args()) for message in messages
+    )
+    command = ["ssh", *_SSH_CONTROL_OPTIONS, ssh_host, remote_script]
+    try:
+        subprocess.run(command, check=True, timeout=20 + 2 * len(messages))
+    except subprocess.TimeoutExpired as exc:
+        LOGGER.error("Timeout SSH notify-send pour %s: %s", ssh_host, exc)
+        return [False] * len(messages)
+    except (subprocess.CalledProcessError, OSError) as exc:
+        LOGGER.error("Erreur SSH notify-send pour %s: %s", ssh_host, exc)
+        return [False] * len(messages)
+
+    LOGGER.info(
+        "%d notifications notify-send envoyées via SSH (%s)", len(messages), ssh_host
+    )
+    return [True] * len(messages)
+
+
 def send_notify_notifications(
-    messages: Iterable[NotificationMessage],
+    messages: Sequence[NotificationMessage],
     ssh_host: str,
     *,
     dry_run: bool = False,
 ) -> List[bool]:
-    """Envoie les notifications via notify-send (SSH si configuré)."""
+    """Envoie les notifications via notify-send (séquence déjà matérialisée)."""
 
-    messages_list = list(messages)
     if not ssh_host or ssh_host.strip() == "":
-        if messages_list:
+        if messages:
             LOGGER.info(
                 "Aucun hôte SSH configuré, %d notifications notify-send ignorées.",
-                len(messages_list),
+                len(messages),
             )
         return []
 
@@ -184,28 +244,29 @@ def send_notify_notifications(
     if ssh_host == _PLACEHOLDER_SSH:
         LOGGER.info(
             "Hôte SSH de placeholder, envoi notify-send ignoré pour %d messages.",
-            len(messages_list),
+            len(messages),
         )
         return []
 
-    results: List[bool] = []
-    for message in messages_list:
-        if dry_run:
+    if not messages:
+        return []
+
+    if dry_run:
+        for message in messages:
             LOGGER.info("[DRY-RUN] notify-send → %s", message.title)
-            results.append(True)
-            continue
+        return [True] * len(messages)
 
-        success = send_notify_send_ssh(message, ssh_host)
+    results = send_notify_send_ssh_batch(messages, ssh_host)
+    for message, success in zip(messages, results):
         if not success:
             LOGGER.error("Echec notify-send pour: %s", message.title)
-        results.append(success)
-
     return results
 
 
 def run_tests(config_path: Path, config: ConfigParser) -> int:
     """Exécute les tests end-to-end."""
 
+    _import_runtime()
     print("=== TEST PlantAlert ===")
 
     db_manager = DatabaseManager.from_config(config_path)
@@ -249,7 +310,20 @@ def run_tests(config_path: Path, config: ConfigParser) -> int:
 def execute_workflow(config_path: Path, config: ConfigParser, *, dry_run: bool) -> int:
     """Exécute le workflow principal de production."""
 
+    _import_runtime()
     start_time = time.perf_counter()
+
+    webhook_url = config.get("notifications", "discord_webhook", fallback="").strip()
+    ssh_host = config.get("notifications", "pc_ssh_host", fallback="").strip()
+    webhook_ok = bool(webhook_url) and webhook_url != _PLACEHOLDER_WEBHOOK
+    ssh_ok = bool(ssh_host) and ssh_host != _PLACEHOLDER_SSH
+
+    if not webhook_ok and not ssh_ok and not dry_run:
+        LOGGER.info(
+            "Aucun canal de notification configuré, analyse météo ignorée."
+        )
+        return 0
+
     try:
         messages = process_weather_alerts(config_path)
     except Exception:
@@ -263,17 +337,21 @@ def execute_workflow(config_path: Path, config: ConfigParser, *, dry_run: bool)
         LOGGER.info("Aucune notification générée. Durée: %.2fs", duration)
         return 0
 
-    webhook_url = config.get("notifications", "discord_webhook", fallback="")
-    ssh_host = config.get("notifications", "pc_ssh_host", fallback="")
-
-    discord_results = send_discord_notifications(messages, webhook_url, dry_run=dry_run)
-    notify_results = send_notify_notifications(messages, ssh_host, dry_run=dry_run)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        discord_future = pool.submit(
+            send_discord_notifications, messages, webhook_url, dry_run=dry_run
+        )
+        notify_future = pool.submit(
+            send_notify_notifications, messages, ssh_host, dry_run=dry_run
+        )
+        discord_results = discord_future.result()
+        notify_results = notify_future.result()
 
-    sent_discord = sum(1 for result in discord_results if result)
-    failed_discord = sum(1 for result in discord_results if result is False)
+    sent_discord = sum(discord_results)
+    failed_discord = len(discord_results) - sent_discord
 
-    sent_notify = sum(1 for result in notify_results if result)
-    failed_notify = sum(1 for result in notify_results if result is False)
+    sent_notify = sum(notify_results)
+    failed_notify = len(notify_results) - sent_notify
 
     duration = time.perf_counter() - start_time
     LOGGER.info(
@@ -2,19 +2,49 @@
 
 from __future__ import annotations
 
-import json
+import functools
 import logging
 import shutil
 import subprocess
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Iterable, List, Optional
-
-import requests
+from typing import Iterable, List, Optional, Sequence
 
 LOGGER = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _get_session():
+    """Construit (une seule fois) la session HTTP partagée des webhooks.
+
+    L'import de requests est différé jusqu'au premier envoi : les runs qui
+    n'ont rien à notifier ne paient pas son coût de démarrage. La session
+    réutilise la même connexion TLS (keep-alive) entre messages.
+    """
+
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=3,
+                connect=2,
+                read=1,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["POST"],
+            ),
+        ),
+    )
+    return session
+
+
 @dataclass(slots=True)
 class NotificationMessage:
     """Structure standardisée d'un message d'alerte."""
@@ -24,15 +54,17 @@ class NotificationMessage:
     severity: str
     timestamp: datetime
 
-    def to_discord_payload(self, mention_roles: Optional[Iterable[str]] = None) -> dict:
+    def to_discord_embed(self, mention_roles: Optional[Iterable[str]] = None) -> dict:
         mentions = " ".join(f"<@&{role}>" for role in mention_roles or [])
-        embed = {
+        return {
             "title": self.title,
             "description": f"{mentions}\n{self.description}".strip(),
             "timestamp": self.timestamp.isoformat(),
             "color": _severity_to_color(self.severity),
         }
-        return {"embeds": [embed]}
+
+    def to_discord_payload(self, mention_roles: Optional[Iterable[str]] = None) -> dict:
+        return {"embeds": [self.to_discord_embed(mention_roles)]}
 
     def to_notify_send_args(self) -> List[str]:
         return [
@@ -42,25 +74,42 @@ class NotificationMessage:
         ]
 
 
+def format_short_datetime(dt: datetime) -> str:
+    """Format compact « jj/mm HHh » (équivalent strftime('%d/%m %Hh') mais ~3x plus rapide)."""
+
+    return f"{dt.day:02d}/{dt.month:02d} {dt.hour:02d}h"
+
+
+_SEVERITY_COLORS = {
+    "info": 0x1E90FF,
+    "warning": 0xFFA500,
+    "watch": 0xFFD700,
+    "orange": 0xFF8C00,
+    "red": 0xFF0000,
+    "critical": 0x8B0000,
+}
+_DEFAULT_COLOR = 0x2E8B57
+
+
 def _severity_to_color(severity: str) -> int:
-    mapping = {
-        "info": 0x1E90FF,
-        "warning": 0xFFA500,
-        "watch": 0xFFD700,
-        "orange": 0xFF8C00,
-        "red": 0xFF0000,
-        "critical": 0x8B0000,
-    }
-    return mapping.get(severity.lower(), 0x2E8B57)
+    return _SEVERITY_COLORS.get(severity.lower(), _DEFAULT_COLOR)
 
 
-def send_discord_webhook(url: str, message: NotificationMessage, mention_roles: Optional[Iterable[str]] = None) -> bool:
-    """Envoie un message formaté vers un webhook Discord."""
+# Discord accepte au plus 10 embeds par requête webhook.
+_DISCORD_MAX_EMBEDS = 10
+
+
+def _post_discord(url: str, payload: dict) -> bool:
+    import requests
 
-    payload = message.to_discord_payload(mention_roles)
-    headers = {"Content-Type": "application/json"}
     try:
-        response = requests.post(url, data=json.dumps(payload, ensure_ascii=False).encode("utf-8"), headers=headers, timeout=10)
+        response = _get_session().post(url, json=payload, timeout=(3.05, 10))
+        if response.status_code >= 400:
+            LOGGER.error(
+                "Webhook Discord refusé (status %s): %s",
+                response.status_code,
+                response.text[:500],
+            )
         response.raise_for_status()
     except requests.RequestException as exc:
         LOGGER.error("Erreur lors de l'envoi du webhook Discord: %s", exc)
@@ -70,10 +119,94 @@ def send_discord_webhook(url: str, message: NotificationMessage, mention_roles:
     return True
 
 
+def send_discord_webhook(url: str, message: NotificationMessage, mention_roles: Optional[Iterable[str]] = None) -> bool:
+    """Envoie un message formaté vers un webhook Discord."""
+
+    return _post_discord(url, message.to_discord_payload(mention_roles))
+
+
+def send_discord_webhook_batch(
+    url: str,
+    messages: Sequence[NotificationMessage],
+    mention_roles: Optional[Iterable[str]] = None,
+) -> List[bool]:
+    """Envoie un lot de messages en regroupant les embeds (10 max par requête).
+
+    Retourne un booléen par message, chaque message héritant du résultat
+    de la requête qui portait son embed.
+    """
+
+    results: List[bool] = []
+    for start in range(0, len(messages), _DISCORD_MAX_EMBEDS):
+        chunk = messages[start : start + _DISCORD_MAX_EMBEDS]
+        payload = {"embeds": [message.to_discord_embed(mention_roles) for message in chunk]}
+        success = _post_discord(url, payload)
+        results.extend([success] * len(chunk))
+    return results
+
+
+# Connexion D-Bus session, ouverte paresseusement et réutilisée entre appels.
+_DBUS_CONNECTION = None
+
+
+def _notify_via_dbus(message: NotificationMessage) -> bool:
+    """Notification via org.freedesktop.Notifications (sans processus externe)."""
+
+    global _DBUS_CONNECTION
+    try:  # pragma: no cover - dépend de l'environnement d'exécution
+        from jeepney import DBusAddress, new_method_call
+        from jeepney.io.blocking import open_dbus_connection
+    except ImportError:  # pragma: no cover
+        return False
+
+    try:
+        if _DBUS_CONNECTION is None:
+            _DBUS_CONNECTION = open_dbus_connection(bus="SESSION")
+
+        address = DBusAddress(
+            "/org/freedesktop/Notifications",
+            bus_name="org.freedesktop.Notifications",
+            interface="org.freedesktop.Notifications",
+        )
+        call = new_method_call(
+            address,
+            "Notify",
+            "susssasa{sv}i",
+            (
+                "PlantAlert",
+                0,
+                "",
+                f"PlantAlert :: {message.severity.upper()}",
+                f"{message.title}\n{message.description}",
+                [],
+                {},
+                -1,
+            ),
+        )
+        _DBUS_CONNECTION.send_and_get_reply(call)
+    except Exception:
+        LOGGER.debug("D-Bus indisponible, repli sur notify-send", exc_info=True)
+        _DBUS_CONNECTION = None
+        return False
+
+    LOGGER.info("Notification locale envoyée (D-Bus)")
+    return True
+
+
+@functools.lru_cache(maxsize=1)
+def _notify_send_path() -> Optional[str]:
+    """Localise notify-send une fois pour toutes (évite un parcours de PATH par appel)."""
+
+    return shutil.which("notify-send")
+
+
 def send_notify_send(message: NotificationMessage) -> bool:
-    """Envoie une notification desktop via notify-send si disponible."""
+    """Envoie une notification desktop (D-Bus si possible, sinon notify-send)."""
+
+    if _notify_via_dbus(message):
+        return True
 
-    if not shutil.which("notify-send"):
+    if not _notify_send_path():
         LOGGER.warning("notify-send introuvable sur ce système")
         return False
 
@@ -104,7 +237,7 @@ def format_plant_alert_message(
 
     description = (
         "📅 Période froide prévue : "
-        f"{start_date.strftime('%d/%m %Hh')} → {end_date.strftime('%d/%m %Hh')}\n"
+        f"{format_short_datetime(start_date)} → {format_short_datetime(end_date)}\n"
         f"🥶 Température mini : {min_temp:.1f}°C\n"
         "➡️ Rentrer les plantes sensibles avant ce soir"
     )
@@ -120,6 +253,8 @@ def format_plant_alert_message(
 __all__ = [
     "NotificationMessage",
     "send_discord_webhook",
+    "send_discord_webhook_batch",
     "send_notify_send",
     "format_plant_alert_message",
+    "format_short_datetime",
 ]
@@ -2,19 +2,29 @@
 
 from __future__ import annotations
 
+import json
 import logging
-from configparser import ConfigParser
-from dataclasses import dataclass
+import os
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Optional, Sequence
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
 
-from meteofrance_api.client import MeteoFranceClient
-from meteofrance_api.model.place import Place
-from zoneinfo import ZoneInfo
+import numpy as np
+
+from .config import load_cached_config
+
+if TYPE_CHECKING:  # imports différés au runtime (voir __init__)
+    from meteofrance_api.client import MeteoFranceClient
+    from meteofrance_api.model.place import Place
+    from zoneinfo import ZoneInfo
 
 LOGGER = logging.getLogger(__name__)
 
+_DEFAULT_PLACE_CACHE = Path.home() / ".cache" / "plantalert" / "place.json"
+_DEFAULT_FORECAST_CACHE = Path.home() / ".cache" / "plantalert" / "forecast.json"
+
 
 @dataclass(slots=True)
 class HourlyTemperature:
@@ -27,6 +37,100 @@ class HourlyTemperature:
     below_freeze: bool
 
 
+@dataclass(slots=True)
+class ForecastFrame:
+    """Prévisions en structure de tableaux (SoA) : une colonne NumPy par champ.
+
+    Les objets ``HourlyTemperature`` ne sont matérialisés qu'à la demande via
+    :meth:`hour`, ce qui garde l'itération compatible avec l'ancien retour
+    ``List[HourlyTemperature]`` tout en exposant les colonnes aux traitements
+    vectorisés.
+    """
+
+    ts_utc: np.ndarray  # int64, epoch UTC
+    temps: np.ndarray  # float64, °C
+    tz: ZoneInfo
+    vigilance_threshold: float
+    freeze_threshold: float
+    below_vigilance: np.ndarray = field(init=False)  # bool_, temps <= vigilance
+    below_freeze: np.ndarray = field(init=False)  # bool_, temps <= gel
+    _fixed_offset_tz: Optional[timezone] = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Deux comparaisons vectorisées pour toute la fenêtre, au lieu d'une
+        # paire de comparaisons Python par heure matérialisée.
+        self.below_vigilance = self.temps <= self.vigilance_threshold
+        self.below_freeze = self.temps <= self.freeze_threshold
+
+        # Si la fenêtre ne traverse pas de changement d'heure, toutes les
+        # conversions locales partagent le même décalage : on interroge la
+        # base tz une seule fois aux deux bornes, puis on travaille avec un
+        # fuseau à décalage fixe (utcoffset en O(1)).
+        self._fixed_offset_tz = None
+        if self.ts_utc.shape[0]:
+            offsets = {
+                datetime.fromtimestamp(bound, tz=timezone.utc).astimezone(self.tz).utcoffset()
+                for bound in (int(self.ts_utc.min()), int(self.ts_utc.max()))
+            }
+            if len(offsets) == 1:
+                self._fixed_offset_tz = timezone(offsets.pop())
+
+    def local_datetime(self, index: int) -> datetime:
+        """Datetime local de l'entrée ``index`` sans recherche tzdata par appel."""
+
+        if self._fixed_offset_tz is not None:
+            return datetime.fromtimestamp(int(self.ts_utc[index]), tz=self._fixed_offset_tz)
+        return datetime.fromtimestamp(int(self.ts_utc[index]), tz=timezone.utc).astimezone(self.tz)
+
+    def hour(self, index: int) -> HourlyTemperature:
+        """Matérialise l'entrée horaire ``index`` sous forme AoS."""
+
+        return HourlyTemperature(
+            timestamp_utc=datetime.fromtimestamp(int(self.ts_utc[index]), tz=timezone.utc),
+            timestamp_local=self.local_datetime(index),
+            temperature_c=float(self.temps[index]),
+            below_vigilance=bool(self.below_vigilance[index]),
+            below_freeze=bool(self.below_freeze[index]),
+        )
+
+    def __len__(self) -> int:
+        return int(self.ts_utc.shape[0])
+
+    def __getitem__(self, index: int) -> HourlyTemperature:
+        return self.hour(index)
+
+    def __iter__(self):
+        return (self.hour(index) for index in range(len(self)))
+
+
+def _extract_raw_entries(hourly_entries: Sequence) -> List[Tuple[int, float]]:
+    """Extrait les couples (timestamp epoch, température) des entrées brutes."""
+
+    raw: List[Tuple[int, float]] = []
+    for entry in hourly_entries:
+        timestamp = getattr(entry, "dt", None)
+        if timestamp is None and isinstance(entry, dict):
+            timestamp = entry.get("dt") or entry.get("time")
+
+        temperature_obj = getattr(entry, "T", None)
+        if temperature_obj is None and isinstance(entry, dict):
+            temperature_obj = entry.get("T")
+
+        if hasattr(temperature_obj, "value"):
+            temperature = getattr(temperature_obj, "value")
+        elif isinstance(temperature_obj, dict):
+            temperature = temperature_obj.get("value")
+        else:
+            temperature = temperature_obj
+
+        if timestamp is None or temperature is None:
+            continue
+
+        raw.append((int(timestamp), float(temperature)))
+
+    return raw
+
+
 class MeteoFranceWeatherClient:
     """Client Meteo-France pour récupérer les prévisions 48h de Collonges-au-Mont-d'Or."""
 
@@ -38,25 +142,42 @@ class MeteoFranceWeatherClient:
         freeze_threshold: float = 0.0,
         forecast_hours: int = 48,
         client: Optional[MeteoFranceClient] = None,
+        place_cache_path: Optional[Path] = None,
+        forecast_ttl_s: float = 900.0,
+        forecast_cache_path: Optional[Path] = None,
     ) -> None:
+        # Imports différés : zoneinfo et meteofrance_api ne sont chargés que
+        # lorsqu'un client est réellement construit, pas à l'import du module.
+        from zoneinfo import ZoneInfo
+
         self.city = city
         self.timezone = ZoneInfo(timezone_name)
         self.vigilance_threshold = vigilance_threshold
         self.freeze_threshold = freeze_threshold
         self.forecast_hours = forecast_hours
-        self._client = client or MeteoFranceClient()
+        self.place_cache_path = Path(place_cache_path) if place_cache_path else _DEFAULT_PLACE_CACHE
+        self.forecast_ttl_s = forecast_ttl_s
+        self.forecast_cache_path = (
+            Path(forecast_cache_path) if forecast_cache_path else _DEFAULT_FORECAST_CACHE
+        )
+        if client is None:
+            from meteofrance_api.client import MeteoFranceClient
+
+            client = MeteoFranceClient()
+        self._client = client
         self._place: Optional[Place] = None
+        self._forecast_cache: Optional[Tuple[float, ForecastFrame]] = None
 
     @classmethod
     def from_config(cls, config_path: Path | str) -> "MeteoFranceWeatherClient":
-        parser = ConfigParser()
-        parser.read(config_path)
+        parser = load_cached_config(config_path)
 
         city = parser.get("location", "city", fallback="Collonges-au-Mont-d'Or")
         timezone_name = parser.get("location", "timezone", fallback="Europe/Paris")
         vigilance = parser.getfloat("thresholds", "vigilance", fallback=3.0)
         freeze = parser.getfloat("thresholds", "freeze", fallback=0.0)
         forecast_hours = parser.getint("timing", "forecast_hours", fallback=48)
+        forecast_ttl_s = parser.getfloat("timing", "forecast_ttl_s", fallback=900.0)
 
         return cls(
             city=city,
@@ -64,23 +185,95 @@ class MeteoFranceWeatherClient:
             vigilance_threshold=vigilance,
             freeze_threshold=freeze,
             forecast_hours=forecast_hours,
+            forecast_ttl_s=forecast_ttl_s,
         )
 
+    def _load_place_from_disk(self) -> Optional[Place]:
+        """Relit la localisation résolue lors d'un run précédent, si présente."""
+
+        try:
+            cached = json.loads(self.place_cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        raw_data = cached.get(self.city)
+        if not raw_data:
+            return None
+
+        from meteofrance_api.model.place import Place
+
+        return Place(raw_data)
+
+    def _store_place_to_disk(self, place: Place) -> None:
+        raw_data = getattr(place, "raw_data", None)
+        if raw_data is None:
+            return
+
+        try:
+            self.place_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.place_cache_path.with_suffix(".json.tmp")
+            tmp_path.write_text(
+                json.dumps({self.city: raw_data}, ensure_ascii=False),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, self.place_cache_path)
+        except OSError:
+            LOGGER.debug("Impossible d'écrire le cache de localisation", exc_info=True)
+
     def _resolve_place(self) -> Place:
         if self._place is not None:
             return self._place
 
+        cached = self._load_place_from_disk()
+        if cached is not None:
+            LOGGER.debug("Localisation %s relue depuis le cache disque", self.city)
+            self._place = cached
+            return self._place
+
         LOGGER.debug("Recherche de la localisation Meteo-France pour %s", self.city)
         places: Sequence[Place] = self._client.search_places(self.city)
         if not places:
             raise RuntimeError(f"Localisation introuvable pour {self.city}")
 
         self._place = places[0]
+        self._store_place_to_disk(self._place)
         return self._place
 
-    def get_forecast_48h(self) -> List[HourlyTemperature]:
-        """Retourne la prévision horaire utile pour la détection de périodes froides."""
+    def _load_raw_forecast_from_disk(self) -> Optional[List[Tuple[int, float]]]:
+        """Relit les prévisions brutes d'un run précédent si encore fraîches."""
+
+        try:
+            cached = json.loads(self.forecast_cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        if cached.get("city") != self.city:
+            return None
+        fetched_at = cached.get("fetched_at")
+        if not isinstance(fetched_at, (int, float)):
+            return None
+        if time.time() - fetched_at >= self.forecast_ttl_s:
+            return None
+
+        entries = cached.get("entries")
+        if not isinstance(entries, list):
+            return None
+        try:
+            return [(int(ts), float(temp)) for ts, temp in entries]
+        except (TypeError, ValueError):
+            return None
 
+    def _store_raw_forecast_to_disk(self, raw: List[Tuple[int, float]]) -> None:
+        payload = {"city": self.city, "fetched_at": time.time(), "entries": raw}
+        try:
+            self.forecast_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.forecast_cache_path.with_suffix(".json.tmp")
+            tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, self.forecast_cache_path)
+        except OSError:
+            LOGGER.debug("Impossible d'écrire le cache de prévisions", exc_info=True)
+
+    def _fetch_raw_forecast(self) -> List[Tuple[int, float]]:
         place = self._resolve_place()
         place_name = getattr(place, "name", self.city)
         LOGGER.debug("Récupération des prévisions pour %s", place_name)
@@ -90,47 +283,50 @@ class MeteoFranceWeatherClient:
         if hourly_entries is None:
             hourly_entries = getattr(forecast, "forecast", [])
 
+        return _extract_raw_entries(hourly_entries)
+
+    def get_forecast_48h(self) -> ForecastFrame:
+        """Retourne la prévision horaire utile pour la détection de périodes froides."""
+
+        cache_enabled = self.forecast_ttl_s > 0
+        if cache_enabled and self._forecast_cache is not None:
+            fetched_at, cached_frame = self._forecast_cache
+            if time.monotonic() - fetched_at < self.forecast_ttl_s:
+                LOGGER.debug("Prévisions servies depuis le cache mémoire")
+                return cached_frame
+
+        raw = self._load_raw_forecast_from_disk() if cache_enabled else None
+        if raw is None:
+            raw = self._fetch_raw_forecast()
+            if cache_enabled:
+                self._store_raw_forecast_to_disk(raw)
+        else:
+            LOGGER.debug("Prévisions relues depuis le cache disque")
+
         now_utc = datetime.now(tz=timezone.utc)
         horizon = now_utc + timedelta(hours=self.forecast_hours)
 
-        results: List[HourlyTemperature] = []
-        for entry in hourly_entries:
-            timestamp = getattr(entry, "dt", None)
-            if timestamp is None and isinstance(entry, dict):
-                timestamp = entry.get("dt") or entry.get("time")
-
-            temperature_obj = getattr(entry, "T", None)
-            if temperature_obj is None and isinstance(entry, dict):
-                temperature_obj = entry.get("T")
-
-            if hasattr(temperature_obj, "value"):
-                temperature = getattr(temperature_obj, "value")
-            elif isinstance(temperature_obj, dict):
-                temperature = temperature_obj.get("value")
-            else:
-                temperature = temperature_obj
-
-            if timestamp is None or temperature is None:
-                continue
-
-            dt_utc = datetime.fromtimestamp(int(timestamp), tz=timezone.utc)
-            if dt_utc > horizon:
-                break
-
-            dt_local = dt_utc.astimezone(self.timezone)
-            temp_value = float(temperature)
-            results.append(
-                HourlyTemperature(
-                    timestamp_utc=dt_utc,
-                    timestamp_local=dt_local,
-                    temperature_c=temp_value,
-                    below_vigilance=temp_value <= self.vigilance_threshold,
-                    below_freeze=temp_value <= self.freeze_threshold,
-                )
-            )
+        if raw:
+            timestamps = np.fromiter((ts for ts, _ in raw), dtype=np.int64, count=len(raw))
+            temps = np.fromiter((temp for _, temp in raw), dtype=np.float64, count=len(raw))
+
+            keep = timestamps <= int(horizon.timestamp())
+            timestamps = timestamps[keep]
+            temps = temps[keep]
+        else:
+            timestamps = np.empty(0, dtype=np.int64)
+            temps = np.empty(0, dtype=np.float64)
 
-        LOGGER.info("Prévisions froides collectées pour %d heures", len(results))
-        return results
+        frame = ForecastFrame(
+            ts_utc=timestamps,
+            temps=temps,
+            tz=self.timezone,
+            vigilance_threshold=self.vigilance_threshold,
+            freeze_threshold=self.freeze_threshold,
+        )
+        LOGGER.info("Prévisions froides collectées pour %d heures", len(frame))
+        self._forecast_cache = (time.monotonic(), frame)
+        return frame
 
 
-__all__ = ["HourlyTemperature", "MeteoFranceWeatherClient"]
+__all__ = ["ForecastFrame", "HourlyTemperature", "MeteoFranceWeatherClient"]